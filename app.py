@@ -1,116 +1,375 @@
 import os
+import io
 import sys
+import csv
+import contextlib
+import atexit
+import shutil
+import subprocess
+import re
+import hashlib
+import tempfile
+import queue
+import time
 import datetime
+import threading
 import logging
+import logging.handlers
+from collections import OrderedDict
+from concurrent import futures
+from dataclasses import dataclass
+from typing import Optional
 
-from flask import Flask, request, jsonify, send_file
-from pymongo import MongoClient, errors
+# ─── Bootstrap & UTF-8 ────────────────────────────────────
+# Before any project import: the utils modules read their knobs
+# (SENTIMENT_INT8, DRIVER_POOL_SIZE, NLTK_SKIP_DOWNLOAD, ...) at import
+from dotenv import load_dotenv
+load_dotenv()
+import certifi
+
+# Force both requests and urllib3 to use the correct Windows CA bundle
+os.environ['SSL_CERT_FILE'] = certifi.where()
+os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
+sys.stdout.reconfigure(encoding='utf-8')
+
+import orjson
+import numpy as np
+import pandas as pd
+from flask import Flask, Response, request, jsonify, send_file
+from flask.json.provider import JSONProvider
+import bson
+from bson.raw_bson import RawBSONDocument
+from pymongo import MongoClient, UpdateOne, WriteConcern, errors
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.jobstores.memory import MemoryJobStore
-import pandas as pd
+from celery import Celery
+from celery.signals import worker_process_init
+from celery.result import AsyncResult
+from kombu.exceptions import OperationalError
+import redis
 
 # topic-modeling helpers
 import matplotlib
 matplotlib.use('Agg')   # non-interactive backend
-import matplotlib.pyplot as plt  # type: ignore: ensure matplotlib is installed
+from matplotlib.figure import Figure
 from utils.topic_modeling import (
     run_topic_modeling_by_phase,
     plot_topic_barchart,
     plot_topic_wordcloud
 )
 from utils.scraper import scrape_x, scrape_facebook
-from utils.sentiment import analyze_sentiment
-from utils.cleaning import clean_text, tokenize_and_lemmatize, geocode_location
+from utils.sentiment import analyze_sentiment_batch, set_cpu_threads, TORCH_THREADS
+from utils.cleaning import (
+    clean_text, clean_text_batch, tokenize_and_lemmatize_batch, geocode_location,
+    reopen_geocode_cache
+)
 
-# ─── Bootstrap & UTF-8 ────────────────────────────────────
-from dotenv import load_dotenv
-load_dotenv()
-import certifi
+# ─── Settings ─────────────────────────────────────────────
+def _parse_date(value: str):
+    """Parse ISO date or return None."""
+    try:
+        return datetime.datetime.fromisoformat(value).replace(
+            tzinfo=datetime.timezone.utc
+        )
+    except Exception:
+        return None
 
-# Force both requests and urllib3 to use the correct Windows CA bundle
-os.environ['SSL_CERT_FILE'] = certifi.where()
-os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
-sys.stdout.reconfigure(encoding='utf-8')
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Environment-derived config for this module, read once at import.
+    Knobs of the utils modules are read there, also after load_dotenv()."""
+    debug: bool
+    log_level: str
+    mongo_uri: str
+    redis_url: str
+    project_start: Optional[datetime.datetime]
+    project_end: Optional[datetime.datetime]
+    scrape_concurrency: int
+    # Keyword sweeps run in parallel threads: BERT inference releases the GIL
+    # inside torch, and the rest of _scrape_store waits on Selenium and Mongo.
+    schedule_workers: int
+    scheduler_enabled: bool
+    fast_insert: bool
+    # LDA E-step processes per fit (joblib/loky, so the GIL doesn't apply);
+    # keep at 1 under a multi-process Celery worker to avoid oversubscription
+    lda_jobs: int
+    # connections each process opens eagerly (every gunicorn worker and
+    # Celery child has its own pool)
+    mongo_min_pool: int
+
+    @classmethod
+    def from_env(cls):
+        debug = os.getenv('FLASK_ENV') == 'development'
+        return cls(
+            debug=debug,
+            log_level=os.getenv('LOG_LEVEL', 'DEBUG' if debug else 'INFO').upper(),
+            mongo_uri=os.getenv('MONGODB_URI', 'mongodb://localhost:27017'),
+            redis_url=os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+            project_start=_parse_date(os.getenv('PROJECT_START_DATE', '')),
+            project_end=_parse_date(os.getenv('PROJECT_END_DATE', '')),
+            scrape_concurrency=int(os.getenv('SCRAPE_CONCURRENCY', 4)),
+            schedule_workers=int(os.getenv('SCHEDULE_WORKERS', min(4, os.cpu_count() or 1))),
+            # extra gunicorn workers opt out with 0 (Celery never runs the cron)
+            scheduler_enabled=os.getenv('SCHEDULER_ENABLED', '1') != '0',
+            # fire-and-forget (w=0) log writes; failures are not reported
+            fast_insert=os.getenv('LOGS_FAST_INSERT', '0') == '1',
+            lda_jobs=int(os.getenv('LDA_JOBS', 1)),
+            mongo_min_pool=int(os.getenv('MONGO_MIN_POOL_SIZE', 0)),
+        )
+
+SETTINGS = Settings.from_env()
 
 # ─── Logger Setup ─────────────────────────────────────────
-logger = logging.getLogger('sentiment_logger')
-logger.setLevel(logging.DEBUG)
-fmt = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+class _DedupFilter(logging.Filter):
+    """Drop an INFO/DEBUG record identical to one emitted within the last
+    `ttl` seconds; warnings, errors and tracebacks always pass."""
+    def __init__(self, ttl: float = 5.0, maxsize: int = 1024):
+        super().__init__()
+        self.ttl, self.maxsize = ttl, maxsize
+        self._seen = OrderedDict()  # key -> last emit time
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or record.exc_info:
+            return True
+        try:
+            key = hash((record.levelno, record.msg, record.args))
+        except TypeError:  # unhashable args (e.g. a dict): always emit
+            return True
+        now = time.monotonic()
+        with self._lock:
+            last = self._seen.get(key)
+            if last is not None and now - last < self.ttl:
+                return False
+            self._seen[key] = now
+            self._seen.move_to_end(key)
+            if len(self._seen) > self.maxsize:
+                self._seen.popitem(last=False)
+        return True
+
+def _configure_logging(logger):
+    """Attach console + file handlers behind a queue listener."""
+    fmt = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+    sh = logging.StreamHandler(sys.stdout)
+    sh.setFormatter(fmt)
 
-sh = logging.StreamHandler(sys.stdout)
-sh.setLevel(logging.DEBUG if os.getenv('FLASK_ENV') == 'development' else logging.INFO)
-sh.setFormatter(fmt)
-logger.addHandler(sh)
+    os.makedirs('logs', exist_ok=True)
+    # Every gunicorn worker and Celery child appends to this one file, so
+    # none of them may rotate it: logrotate does, and each process reopens
+    # the file once it has been moved
+    fh = logging.handlers.WatchedFileHandler(
+        'logs/app.log', encoding='utf-8', errors='replace'
+    )
+    fh.setFormatter(fmt)
 
-os.makedirs('logs', exist_ok=True)
-fh = logging.FileHandler('logs/app.log', encoding='utf-8', errors='replace')
-fh.setLevel(logging.DEBUG)
-fh.setFormatter(fmt)
-logger.addHandler(fh)
+    # Console and file writes happen on a listener thread, off the request path
+    log_q = queue.Queue(-1)
+    qh = logging.handlers.QueueHandler(log_q)
+    qh.addFilter(_DedupFilter())  # repeated lines never reach the queue
+    logger.addHandler(qh)
+    listener = logging.handlers.QueueListener(log_q, sh, fh, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+# Filter at the logger, not per handler, so disabled levels never build a record
+logger = logging.getLogger('sentiment_logger')
+logger.setLevel(getattr(logging, SETTINGS.log_level, logging.INFO))
+logger.propagate = False
+# Re-imports (reloader, tests, __main__ vs app) must not stack handlers
+if not logger.handlers:
+    _configure_logging(logger)
 
 # ─── Flask & MongoDB Setup ─────────────────────────────────
+# PyMongo decodes BSON dates as naive UTC datetimes; label them as UTC
+JSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+class OrjsonProvider(JSONProvider):
+    """Serve jsonify() through orjson; unknown types fall back to str()."""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str, option=JSON_OPTS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=str, option=JSON_OPTS),
+            mimetype='application/json'
+        )
+
 app = Flask(__name__)
-DEBUG = os.getenv('FLASK_ENV') == 'development'
-mongo_uri = os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
-client = MongoClient(mongo_uri, serverSelectionTimeoutMS=5000)
+app.json = OrjsonProvider(app)
+client = MongoClient(
+    SETTINGS.mongo_uri,
+    maxPoolSize=200,
+    minPoolSize=SETTINGS.mongo_min_pool,
+    compressors='zstd,zlib',  # zstandard is pinned; zlib ships with Python
+    zlibCompressionLevel=3,
+    retryWrites=True,
+    serverSelectionTimeoutMS=5000,
+    socketTimeoutMS=10000
+)
 db = client['sentiment_db']
-logs = db['logs']
-topics_col = db['topics']
-logger.info('Connected to MongoDB at %s', mongo_uri)
+# Scraped sentiment is re-collectable, so skip the journal wait on its writes,
+# or skip the acknowledgement entirely in fast-insert mode
+logs = db.get_collection(
+    'logs',
+    write_concern=WriteConcern(w=0) if SETTINGS.fast_insert else WriteConcern(w=1, j=False)
+)
+# Topic runs and the tracked-keyword list can't be re-scraped, so they stay
+# acknowledged even if MONGODB_URI sets a looser default (e.g. w=0)
+_ACKED = WriteConcern(w=1)
+topics_col = db.get_collection('topics', write_concern=_ACKED)
+# one doc per tracked keyword, for the scheduler
+keywords_col = db.get_collection('keywords', write_concern=_ACKED)
+# one doc per completed one-off data migration
+migrations_col = db.get_collection('migrations', write_concern=_ACKED)
+logger.info('Connected to MongoDB at %s', SETTINGS.mongo_uri)
 
-# ─── Project Phase Helpers ─────────────────────────────────
-def _parse_date(env_key: str):
-    """Parse ISO date from env or return None."""
-    s = os.getenv(env_key, '')
-    try:
-        return datetime.datetime.fromisoformat(s).replace(
-            tzinfo=datetime.timezone.utc
-        )
-    except Exception:
-        return None
+# Indexes: distinct('keyword') for the scheduler (the compound index's prefix
+# serves it), per-keyword time ranges, platform/time for exports, and the
+# latest topics per keyword set for /topics
+try:
+    logs.create_index([('keyword', 1), ('timestamp', -1)])
+    logs.create_index([('platform', 1), ('timestamp', 1)])
+    topics_col.create_index([('keywords', 1), ('time', -1)])
+except errors.PyMongoError:
+    logger.warning('Could not ensure MongoDB indexes', exc_info=True)
 
-PROJECT_START = _parse_date('PROJECT_START_DATE')
-PROJECT_END   = _parse_date('PROJECT_END_DATE')
+# ─── Project Phase Helpers ─────────────────────────────────
+_NAT_NS = np.iinfo(np.int64).min  # how NaT shows up in asi8
+# Window bounds as epoch nanoseconds: a timestamp's bucket among these edges
+# (0 before, 1 during, 2 after) indexes _PHASES. An open start only sits
+# above NaT; an open end sits above everything.
+_PHASE_EDGES = np.array([
+    pd.Timestamp(SETTINGS.project_start).value if SETTINGS.project_start else _NAT_NS + 1,
+    pd.Timestamp(SETTINGS.project_end).value + 1 if SETTINGS.project_end else np.iinfo(np.int64).max,
+], dtype=np.int64)
+_PHASES = np.array(['before', 'during', 'after', 'during'], dtype=object)  # [3]: NaT/missing
+_PHASE_UNKNOWN = 3
 
-def _project_phase(ts_iso: str) -> str:
-    """Tag timestamp as before/during/after project window."""
-    try:
-        ts = datetime.datetime.fromisoformat(
-            ts_iso.rstrip('Z')
-        ).replace(tzinfo=datetime.timezone.utc)
-        if PROJECT_START and ts < PROJECT_START:
-            return 'before'
-        if PROJECT_END and ts > PROJECT_END:
-            return 'after'
-    except Exception:
-        pass
-    return 'during'
+def _project_phases(ts_isos: list) -> list:
+    """Tag a batch of timestamps as before/during/after project window."""
+    # Posts share timestamps heavily (reposts, both tabs), so parse each
+    # distinct string once and broadcast back; missing values get code -1
+    codes, uniques = pd.factorize(pd.Series(ts_isos, dtype=object))
+    ts = pd.to_datetime(pd.Series(uniques, dtype=object), utc=True,
+                        errors='coerce', format='ISO8601')
+    ns = ts.dt.as_unit('ns').array.asi8
+    bucket = np.searchsorted(_PHASE_EDGES, ns, side='right')
+    # unparseable timestamps (NaT) and missing ones (code -1) stay 'during'
+    bucket[ns == _NAT_NS] = _PHASE_UNKNOWN
+    bucket = np.append(bucket, _PHASE_UNKNOWN)
+    return _PHASES[bucket[codes]].tolist()
 
 # ─── Persistence ───────────────────────────────────────────
-def _save(doc: dict):
-    """Insert a document into MongoDB, log on failure."""
+INSERT_CHUNK = 1000  # docs per bulk_write round-trip
+
+def _content_id(platform: str, keyword: str, *fields) -> str:
+    """Stable id so re-scraped items map onto their existing document.
+    `fields` must identify the post (author, time, text), not just its
+    text: distinct posts can clean to the same (or empty) text."""
+    key = '|'.join(map(str, (platform, keyword, *fields)))
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+class _IdCache:
+    """Bounded LRU of ids known to be in logs, so re-scraped posts skip the lookup."""
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._ids = OrderedDict()  # id -> None
+        self._lock = threading.Lock()
+
+    def split(self, ids: list):
+        """Return (known ids, ids that still need a database lookup)."""
+        known, unknown = set(), []
+        with self._lock:
+            for i in ids:
+                if i in self._ids:
+                    self._ids.move_to_end(i)
+                    known.add(i)
+                else:
+                    unknown.append(i)
+        return known, unknown
+
+    def add(self, ids):
+        with self._lock:
+            for i in ids:
+                self._ids[i] = None
+                self._ids.move_to_end(i)
+            while len(self._ids) > self.maxsize:
+                self._ids.popitem(last=False)
+
+_known_ids = _IdCache(maxsize=100_000)  # ~10 MB of hex ids
+
+def _stored_ids(ids: list) -> set:
+    """Return the subset of `ids` already present in logs."""
+    known, unknown = _known_ids.split(ids)
+    if not unknown:
+        return known
     try:
-        logs.insert_one(doc)
+        found = {d['_id'] for d in logs.find({'_id': {'$in': unknown}}, {'_id': 1})}
     except errors.PyMongoError:
-        logger.exception('DB insert failed')
+        logger.warning('Stored-id lookup failed; analyzing all items', exc_info=True)
+        return known
+    _known_ids.add(found)
+    return known | found
+
+def _save(docs: list):
+    """Insert documents (carrying their _content_id as _id) into MongoDB in chunks."""
+    ids = [d['_id'] for d in docs]
+    # Callers drop known ids up front, so plain inserts beat upserts here;
+    # encode each doc to BSON once, the driver copies raw bytes on (re)send
+    raw = [RawBSONDocument(bson.encode(d)) for d in docs]
+    for i in range(0, len(raw), INSERT_CHUNK):
+        chunk_ids = ids[i:i + INSERT_CHUNK]
+        try:
+            logs.insert_many(raw[i:i + INSERT_CHUNK], ordered=False,
+                             # not allowed with unacknowledged (w=0) writes
+                             bypass_document_validation=not SETTINGS.fast_insert)
+            _known_ids.add(chunk_ids)
+        except errors.BulkWriteError as e:
+            # duplicate _id (11000): a concurrent job stored the post first
+            write_errors = [err for err in e.details.get('writeErrors', [])
+                            if err.get('code') != 11000]
+            if write_errors:
+                logger.error('DB bulk write partially failed: %d write errors',
+                             len(write_errors))
+                # each entry repeats the offending doc; only repr them when asked
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('Write errors: %r', write_errors)
+            failed = {err['index'] for err in write_errors}
+            _known_ids.add(_id for n, _id in enumerate(chunk_ids) if n not in failed)
+        except errors.PyMongoError:
+            logger.exception('DB insert failed')
 
 # ─── Scrape, Clean, Analyze & Store ───────────────────────
+# Shared by every job, so it also caps how many scrapers (browsers) run at once
+_scrape_pool = futures.ThreadPoolExecutor(max_workers=SETTINGS.scrape_concurrency,
+                                          thread_name_prefix='scrape')
+
+# Lets one platform's bulk write overlap the other's NLP work
+_save_pool = futures.ThreadPoolExecutor(max_workers=SETTINGS.scrape_concurrency,
+                                        thread_name_prefix='save')
+
 def _scrape_store(keywords: str):
     """Full pipeline: scrape → clean → topics by phase → visualize → sentiment → store."""
     now = datetime.datetime.now(datetime.timezone.utc).isoformat()
     logger.info('[JOB] scrape %s @ %s', keywords, now)
 
-    # 1) Scrape X.com posts
-    x_raw = scrape_x(keywords, headless=not DEBUG)
+    # 1) Scrape X.com and Facebook concurrently (independent network I/O)
+    fx = _scrape_pool.submit(scrape_x, keywords, headless=not SETTINGS.debug)
+    ff = _scrape_pool.submit(scrape_facebook, keywords)
+    x_raw = fx.result() or []
+    fb_posts = ff.result() or []
 
-    # 2) Clean and tag phase
-    texts, phases = [], []
-    for rec in x_raw:
-        txt = clean_text(rec['content'])
-        rec['clean'] = txt
-        texts.append(txt)
-        phases.append(_project_phase(rec['date']))
+    # 2) Drop items without text up front, then clean and tag phase
+    x_raw = [r for r in x_raw if isinstance(r.get('content'), str)]
+    fb_posts = [p for p in fb_posts if isinstance(p.get('post_text'), str)]
+    texts = clean_text_batch([rec['content'] for rec in x_raw])
+    phases = _project_phases([rec['date'] for rec in x_raw])
 
     # 3) Fit LDA separately by phase (during/after)
     lda_results = {}
@@ -122,7 +381,8 @@ def _scrape_store(keywords: str):
             num_words=7,
             doc_topic_prior=0.1,
             topic_word_prior=0.01,
-            display_rule='fixed'
+            display_rule='fixed',
+            n_jobs=SETTINGS.lda_jobs
         )
         # Persist human-friendly names and top keywords
         topics_col.replace_one(
@@ -132,115 +392,428 @@ def _scrape_store(keywords: str):
                 'time': now,
                 'topics': {
                     phase: list(topics)  # SonarQube-friendly
-                    for phase, (_, _, topics) in lda_results.items()
+                    for phase, (_, _, topics, _) in lda_results.items()
                 }
             },
             upsert=True
         )
 
     # 4) Visualize & save charts per phase/topic
+    #    (plain Figures, not pyplot: no global state to lock across jobs and
+    #    nothing left registered afterwards; each is cleared and redrawn)
     os.makedirs('charts', exist_ok=True)
-    for phase, (vec, lda_model, topics) in lda_results.items():
-        for t in topics:
-            pid = f"{phase}-{t['topic_id']}"
-            # 4a) Bar chart
-            plot_topic_barchart(pid, t['top_keywords'])
-            plt.savefig(f"charts/{pid}_bar.png")
-            # 4b) Word cloud
-            plot_topic_wordcloud(pid, t['full_distribution'])
-            plt.savefig(f"charts/{pid}_wc.png")
-
-    # 5) Assign dominant topic & store records
-    for rec, txt, phase in zip(x_raw, texts, phases):
-        vec_lda = lda_results.get(phase)
-        if vec_lda:
-            vec, lda_model, topics = vec_lda
-            dist = lda_model.transform(vec.transform([txt]))[0]
-            dom = int(dist.argmax())
-            top_kw = topics[dom]['top_keywords']
+    if lda_results:
+        bar_ax = Figure().subplots()
+        wc_ax = Figure(figsize=(10, 5)).subplots()
+        for phase, (_, _, topics, _) in lda_results.items():
+            for t in topics:
+                pid = f"{phase}-{t['topic_id']}"
+                # 4a) Bar chart
+                bar_ax.clear()
+                plot_topic_barchart(pid, t['top_keywords'], ax=bar_ax)
+                bar_ax.figure.savefig(f"charts/{pid}_bar.png")
+                # 4b) Word cloud
+                wc_ax.clear()
+                plot_topic_wordcloud(pid, t['full_distribution'], ax=wc_ax)
+                wc_ax.figure.savefig(f"charts/{pid}_wc.png")
+
+    # 5) Assign dominant topic & store records, skipping posts already stored
+    #    or repeated in this batch (their upsert would be a no-op, so the NLP
+    #    work would be wasted)
+    #    (helpers bound to locals: these loops run once per scraped item)
+    geocode = geocode_location
+    # the scraper's own identity for a tweet: author, time and text
+    x_ids = [_content_id('x', keywords, rec['username'], rec['date'], txt)
+             for rec, txt in zip(x_raw, texts)]
+    stored = _stored_ids(x_ids)
+    x_new = []
+    for i, k in enumerate(x_ids):
+        if k not in stored:
+            stored.add(k)
+            x_new.append(i)
+    x_docs = []
+    append = x_docs.append
+    x_texts = [texts[i] for i in x_new]
+    # Dominant topic per post from the distributions LDA computed while
+    # fitting (-1 where the phase had no model)
+    dom_all = np.full(len(texts), -1, dtype=np.intp)
+    phase_arr = np.array(phases, dtype=object)
+    for phase, (_, _, _, dist) in lda_results.items():
+        dom_all[np.flatnonzero(phase_arr == phase)] = dist.argmax(axis=1)
+    x_dom = dom_all[x_new]
+    x_sents = analyze_sentiment_batch(x_texts)
+    x_toks = tokenize_and_lemmatize_batch(x_texts)
+    for i, sent, toks, dom in zip(x_new, x_sents, x_toks, x_dom.tolist()):
+        rec, phase = x_raw[i], phases[i]
+        if dom >= 0:
+            top_kw = lda_results[phase][2][dom]['top_keywords']
         else:
             dom, top_kw = None, []
 
-        sent = analyze_sentiment(txt)
-        record = {
-            'tokens': tokenize_and_lemmatize(txt),
-            'geo': geocode_location(rec['username']),
+        user = rec['username']
+        append({
+            '_id': x_ids[i],
+            **sent,
+            'tokens': toks,
+            'geo': geocode(user),
             'platform': 'x',
-            'text': txt,
-            'meta': {'username': rec['username'], 'date': rec['date']},
+            'meta': {'username': user, 'date': rec['date']},
             'timestamp': now,
             'project_phase': phase,
             'keyword': keywords,
             'topic': dom,
             'topic_keywords': top_kw
-        }
-        sent.update(record)
-        _save(sent)
-
-    logger.info('Saved %d X posts', len(x_raw))
+        })
+    logger.debug('Prepared %d X posts', len(x_docs))
+    # Write X posts while the Facebook items go through the NLP stages
+    x_saved = _save_pool.submit(_save, x_docs)
 
     # ─── Repeat for Facebook ───────────────────────────────
-    fb_posts = scrape_facebook(keywords)
     seen = set()
+    fb_unique = []
     for p in fb_posts:
         key = (p['post_time'], p['post_text'][:30])
         if key in seen:
             continue
         seen.add(key)
+        fb_unique.append(p)
 
-        text = clean_text(p['post_text'])
-        phase = _project_phase(p['post_time'])
-        sent = analyze_sentiment(text)
-        record = {
-            'tokens': tokenize_and_lemmatize(text),
-            'geo': geocode_location(p.get('page')),
+    fb_texts = clean_text_batch([p['post_text'] for p in fb_unique])
+    fb_ids = [_content_id('facebook', keywords, p['post_time'], text)
+              for p, text in zip(fb_unique, fb_texts)]
+    stored = _stored_ids(fb_ids)
+    fb_new = []
+    for p, text, k in zip(fb_unique, fb_texts, fb_ids):
+        if k not in stored:
+            stored.add(k)
+            fb_new.append((p, text, k))
+    fb_unique = [p for p, _, _ in fb_new]
+    fb_texts = [text for _, text, _ in fb_new]
+    fb_ids = [k for _, _, k in fb_new]
+    fb_docs = []
+    append = fb_docs.append
+    fb_sents = analyze_sentiment_batch(fb_texts)
+    fb_toks = tokenize_and_lemmatize_batch(fb_texts)
+    fb_phases = _project_phases([p['post_time'] for p in fb_unique])
+    for p, k, sent, toks, phase in zip(fb_unique, fb_ids, fb_sents, fb_toks, fb_phases):
+        post_time = p['post_time']
+        append({
+            '_id': k,
+            **sent,
+            'tokens': toks,
+            'geo': geocode(p.get('page')),
             'platform': 'facebook',
-            'text': text,
-            'meta': {'post_time': p['post_time']},
+            'meta': {'post_time': post_time},
             'timestamp': now,
             'project_phase': phase,
-            'keyword': keywords,
-        }
-        sent.update(record)
-        _save(sent)
+            'keyword': keywords
+        })
+
+    # 6) Write the Facebook items and wait for the X write to land
+    _save(fb_docs)
+    x_saved.result()
+    if x_docs or fb_docs:
+        _track_keyword(keywords, now)
+    logger.info('[JOB] saved %d new X posts, %d new FB items',
+                len(x_docs), len(fb_docs))
+
+# ─── Model Warm-up ────────────────────────────────────────
+def _is_reloader_parent() -> bool:
+    """The debug reloader imports this module twice; only its child serves."""
+    return (__name__ == '__main__' and SETTINGS.debug
+            and os.getenv('WERKZEUG_RUN_MAIN') != 'true')
 
-    logger.info('[JOB] saved %d FB items', len(seen))
+def _warm_up():
+    """Run each NLP stage once so the first job skips the lazy loads
+    (punkt/WordNet corpora, BERT's first forward pass)."""
+    started = time.perf_counter()
+    try:
+        txt = clean_text('Warm-up post about the Nairobi Expressway')
+        analyze_sentiment_batch([txt])
+        tokenize_and_lemmatize_batch([txt])
+    except Exception:
+        logger.warning('Model warm-up failed', exc_info=True)
+        return
+    logger.info('Models warmed up in %.1fs', time.perf_counter() - started)
+
+def _is_celery_cli() -> bool:
+    """`celery -A app.celery worker` imports this module in the main process
+    its pool forks from; torch threads started there don't survive the fork."""
+    return 'celery.bin.worker' in sys.modules
+
+if not (_is_reloader_parent() or _is_celery_cli()):
+    _warm_up()
+
+# ─── Background Tasks ─────────────────────────────────────
+# Worker: celery -A app.celery worker
+celery = Celery('sentiment', broker=SETTINGS.redis_url, backend=SETTINGS.redis_url)
+
+@worker_process_init.connect
+def _init_worker_process(**_):
+    """Redo the import-time setup a forked pool process can't inherit."""
+    # the parent's listener thread doesn't exist here, so nothing would
+    # drain the inherited queue
+    for h in list(logger.handlers):
+        logger.removeHandler(h)
+    _configure_logging(logger)
+    reopen_geocode_cache()
+    # the inherited thread count is sized for the machine, not for one of
+    # the pool's processes (worker_concurrency defaults to the core count)
+    cores = os.cpu_count() or 1
+    procs = celery.conf.worker_concurrency or cores
+    set_cpu_threads(TORCH_THREADS or max(1, cores // procs))
+    _warm_up()
+
+@celery.task(name='scrape_store')
+def scrape_task(keywords: str):
+    _scrape_store(keywords)
+
+# In-process fallback when the broker is down; reused across requests
+_job_pool = futures.ThreadPoolExecutor(max_workers=SETTINGS.scrape_concurrency,
+                                       thread_name_prefix='job')
+
+def _log_job_failure(keyword: str):
+    """Done-callback: no one waits on a fallback job, so log what it raised."""
+    def callback(fut):
+        if fut.exception() is not None:
+            logger.error('[JOB] scrape %s failed', keyword, exc_info=fut.exception())
+    return callback
 
 # ─── HTTP: /scrape ────────────────────────────────────────
 @app.route('/scrape', methods=['POST'])
 def scrape_api():
+    """Queue one scrape job per keyword and return their ids (202)."""
     data = request.get_json(force=True) or {}
     kws = data.get('keywords') if isinstance(data.get('keywords'), list) else [data.get('keyword')]
     kws = [str(k).strip() for k in kws if k]
     if not kws:
         return jsonify(error="Provide 'keyword' or non-empty list 'keywords'"), 400
-    for kw in kws:
-        _scrape_store(kw)
-    return jsonify(message=f'Scraped {len(kws)} keyword(s)'), 200
+    ids = []
+    for n, kw in enumerate(kws):
+        try:
+            ids.append(scrape_task.delay(kw).id)
+        except OperationalError:
+            # only what wasn't queued yet, or those keywords would run twice
+            rest = kws[n:]
+            logger.warning('Broker unreachable; running %d keyword(s) in-process', len(rest))
+            for kw in rest:
+                _job_pool.submit(_scrape_store, kw).add_done_callback(_log_job_failure(kw))
+            return jsonify(message=f'Queued {len(ids)} and started {len(rest)} '
+                                   f'keyword(s) in-process', job_ids=ids), 202
+    return jsonify(message=f'Queued {len(kws)} keyword(s)', job_ids=ids), 202
+
+# ─── HTTP: /job/<id> ──────────────────────────────────────
+@app.route('/job/<job_id>', methods=['GET'])
+def job_status(job_id):
+    res = AsyncResult(job_id, app=celery)
+    return jsonify(id=job_id, state=res.state)
 
 # ─── HTTP: /export/<fmt> ──────────────────────────────────
+EXPORT_FIELDS = [
+    'platform', 'keyword', 'timestamp', 'project_phase', 'text',
+    'textblob_polarity', 'vader', 'bert_sentiment', 'swahili_sentiment',
+    'topic', 'topic_keywords', 'tokens', 'geo', 'meta'
+]
+EXPORT_PROJECTION = {f: 1 for f in EXPORT_FIELDS} | {'_id': 0}
+EXPORT_FLUSH_ROWS = 1000  # rows buffered per yielded chunk
+
+def _csv_cell(value):
+    """Nested fields (vader, geo, meta, tokens) as JSON, like mongoexport writes them."""
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value, default=str, option=JSON_OPTS).decode()
+    return value
+
+def _export_csv(cursor):
+    """Yield CSV text in chunks straight from a Mongo cursor."""
+    buf = io.StringIO()
+    writerow = csv.writer(buf).writerow
+    writerow(EXPORT_FIELDS)
+    with cursor:  # closed server-side even if the client disconnects
+        for n, doc in enumerate(cursor, 1):
+            # csv writes None as '', so missing fields need no special-casing
+            writerow(map(_csv_cell, map(doc.get, EXPORT_FIELDS)))
+            if n % EXPORT_FLUSH_ROWS == 0:
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate(0)
+    yield buf.getvalue()
+
+def _export_json(cursor):
+    """Yield a JSON array in chunks of EXPORT_FLUSH_ROWS documents."""
+    chunk = [b'[']
+    with cursor:
+        for n, doc in enumerate(cursor):
+            if n:
+                chunk.append(b',')
+            chunk.append(orjson.dumps(doc, default=str, option=JSON_OPTS))
+            if (n + 1) % EXPORT_FLUSH_ROWS == 0:
+                yield b''.join(chunk)
+                chunk.clear()
+    chunk.append(b']')
+    yield b''.join(chunk)
+
+EXPORT_DIR = 'exports'
+EXPORT_NAME_RE = re.compile(r'logs-(\d+)\.csv')
+# Per process only: gunicorn's workers may export concurrently, so each
+# run writes its own temp file and only older exports are removed
+_EXPORT_LOCK = threading.Lock()
+
+def _run_mongoexport(exe: str, path: str, count: int) -> bool:
+    """Write the logs collection to `path` as CSV; False if mongoexport failed."""
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=EXPORT_DIR)
+    os.close(fd)
+    # The URI may carry credentials: hand it over in a 0600 config file
+    # rather than on the command line, where any user can read it
+    fd, cfg = tempfile.mkstemp(suffix='.yaml')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b'uri: ' + orjson.dumps(SETTINGS.mongo_uri) + b'\n')  # JSON strings are YAML
+        subprocess.run(
+            [exe, f'--config={cfg}', f'--db={db.name}',
+             '--collection=logs', '--type=csv',
+             f'--fields={",".join(EXPORT_FIELDS)}', f'--out={tmp}'],
+            check=True, capture_output=True, timeout=600
+        )
+        os.replace(tmp, path)
+    except (OSError, subprocess.SubprocessError):
+        logger.warning('mongoexport failed; streaming instead', exc_info=True)
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        return False
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(cfg)
+    # drop exports of older counts; temp files may be another worker's run
+    for name in os.listdir(EXPORT_DIR):
+        m = EXPORT_NAME_RE.fullmatch(name)
+        if m and int(m[1]) < count:
+            with contextlib.suppress(OSError):
+                os.remove(os.path.join(EXPORT_DIR, name))
+    return True
+
+def _mongoexport_csv():
+    """
+    Have mongoexport (run on this host) dump the logs to a CSV file, reusing
+    it while the log count is unchanged (logs are insert-only).
+    Returns the open file, or None to fall back to streaming the cursor.
+    """
+    exe = shutil.which('mongoexport')
+    if not exe:
+        return None
+    try:
+        count = logs.estimated_document_count()
+    except errors.PyMongoError:
+        return None
+    path = os.path.join(EXPORT_DIR, f'logs-{count}.csv')
+    with _EXPORT_LOCK:  # one export run at a time; later callers reuse it
+        if not os.path.exists(path) and not _run_mongoexport(exe, path, count):
+            return None
+    try:
+        # an open file outlives another worker's cleanup removing it
+        return open(path, 'rb')
+    except OSError:
+        return None
+
 @app.route('/export/<fmt>', methods=['GET'])
 def export_data(fmt):
-    """Export all stored docs as CSV or JSON."""
-    recs = list(logs.find({}, {'_id': 0}))
-    df = pd.DataFrame(recs)
-    fname = f'export.{fmt}'
+    """Export all stored docs as CSV (via mongoexport when available) or JSON."""
+    if fmt == 'csv' and (f := _mongoexport_csv()):
+        return send_file(f, mimetype='text/csv', as_attachment=True,
+                         download_name='export.csv')
+    cursor = logs.find({}, EXPORT_PROJECTION, batch_size=EXPORT_FLUSH_ROWS)
     if fmt == 'csv':
-        df.to_csv(fname, index=False)
+        body, mimetype = _export_csv(cursor), 'text/csv'
     else:
-        df.to_json(fname, orient='records', force_ascii=False)
-    return send_file(fname, as_attachment=True)
+        fmt, body, mimetype = 'json', _export_json(cursor), 'application/json'
+    return Response(
+        body,
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename=export.{fmt}'}
+    )
 
 @app.route('/topics')
 def list_topics():
     kws = request.args.getlist('keyword')
-    rec = topics_col.find_one({'keywords': kws}, {'_id': 0})
+    rec = topics_col.find_one({'keywords': kws}, {'_id': 0}, sort=[('time', -1)])
     return jsonify(rec or {})
 
 # ─── Scheduler ────────────────────────────────────────────
+def _track_keyword(keyword: str, now: str):
+    try:
+        keywords_col.update_one({'_id': keyword}, {'$set': {'last_saved': now}}, upsert=True)
+    except errors.PyMongoError:
+        logger.exception('Keyword bookkeeping failed')
+
+# Marks that keywords_col already holds every keyword stored in logs before
+# the collection existed; "collection is empty" can't tell, since a /scrape
+# may track its keyword first
+KEYWORDS_SEEDED = 'keywords_seeded'
+
+def _seed_tracked_keywords():
+    """One-off: copy the keywords of a database that predates keywords_col."""
+    try:
+        if migrations_col.find_one({'_id': KEYWORDS_SEEDED}, {'_id': 1}):
+            return
+        # a DISTINCT_SCAN over the keyword/timestamp index, not a COLLSCAN
+        kws = logs.distinct('keyword')
+        if kws:
+            # $setOnInsert keeps last_saved of keywords already tracked;
+            # concurrent seeds from other workers are harmless
+            keywords_col.bulk_write(
+                [UpdateOne({'_id': kw}, {'$setOnInsert': {'_id': kw}}, upsert=True)
+                 for kw in kws],
+                ordered=False
+            )
+        migrations_col.update_one({'_id': KEYWORDS_SEEDED},
+                                  {'$setOnInsert': {'done': True}}, upsert=True)
+        logger.info('Seeded %d tracked keyword(s) from logs', len(kws))
+    except errors.PyMongoError:
+        # retried by the next startup or sweep
+        logger.warning('Could not seed tracked keywords', exc_info=True)
+
+def _tracked_keywords() -> list:
+    """Keywords to re-scrape: O(#keywords) instead of scanning logs."""
+    _seed_tracked_keywords()  # one marker lookup once seeded
+    return keywords_col.distinct('_id')
+
+# Each host runs one scheduler (see gunicorn.conf.py); across hosts this lock lets
+# only the first to fire run the sweep. It is left to expire, not released,
+# so a host whose clock is a little behind still finds it held.
+SWEEP_LOCK_TTL = 3600  # seconds
+_redis = redis.Redis.from_url(SETTINGS.redis_url)
+
+def _claim_sweep() -> bool:
+    try:
+        return bool(_redis.set('sentiment:daily-sweep', os.getpid(), nx=True, ex=SWEEP_LOCK_TTL))
+    except redis.RedisError:
+        # Redis down means Celery is too; let this host sweep in-process
+        return True
+
 def _scheduled():
-    for kw in logs.distinct('keyword'):
-        _scrape_store(kw)
+    if not _claim_sweep():
+        logger.info('[JOB] daily sweep already claimed by another host')
+        return
+    kws = _tracked_keywords()
+    # Prefer the Celery workers, which scale out across hosts; whatever
+    # couldn't be queued is swept here, concurrently
+    for n, kw in enumerate(kws):
+        try:
+            scrape_task.delay(kw)
+        except OperationalError:
+            kws = kws[n:]
+            logger.warning('Broker unreachable; sweeping %d keyword(s) in-process', len(kws))
+            break
+    else:
+        logger.info('[JOB] queued %d keyword(s) for the daily sweep', len(kws))
+        return
+    with futures.ThreadPoolExecutor(max_workers=min(SETTINGS.schedule_workers, len(kws)),
+                                    thread_name_prefix='sweep') as ex:
+        jobs = {ex.submit(_scrape_store, kw): kw for kw in kws}
+        # one failing keyword must not hide the others' results
+        for fut in futures.as_completed(jobs):
+            if fut.exception() is not None:
+                logger.error('[JOB] scrape %s failed', jobs[fut], exc_info=fut.exception())
 
 # Scheduler config to prevent overlaps and delays
 executors = {
@@ -265,8 +838,17 @@ sched.add_job(
     coalesce=True,
     misfire_grace_time=900
 )
-sched.start()
+
+def _scheduler_enabled() -> bool:
+    """Start the cron in exactly one process per deployment."""
+    return (SETTINGS.scheduler_enabled
+            and not (_is_reloader_parent() or _is_celery_cli()))
+
+if _scheduler_enabled():
+    _seed_tracked_keywords()
+    sched.start()
+    atexit.register(sched.shutdown, wait=False)
 
 if __name__ == '__main__':
-    logger.info('Starting Flask (debug=%s)', DEBUG)
-    app.run(debug=DEBUG)
+    logger.info('Starting Flask (debug=%s)', SETTINGS.debug)
+    app.run(debug=SETTINGS.debug)
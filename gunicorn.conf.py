@@ -0,0 +1,44 @@
+"""
+Gunicorn settings for production.
+
+    gunicorn -c gunicorn.conf.py
+"""
+import os
+
+wsgi_app = 'wsgi:app'
+worker_class = 'gevent'
+# each worker loads its own copy of the BERT model
+workers = int(os.getenv('WEB_CONCURRENCY', 4))
+worker_connections = 1000
+timeout = 600  # in-process scrapes run long when the broker is down
+
+
+# The worker running the daily cron (see app._scheduler_enabled) is kept on
+# the arbiter, not in this module: a reload (SIGHUP) re-executes this file.
+# It is matched by identity, so only that worker's exit frees the cron;
+# the Redis lock in app._claim_sweep covers the brief overlap while a
+# reload replaces the owner.
+
+
+def pre_fork(server, worker):
+    # Hand the cron to the first worker, and to a replacement once the
+    # owner dies, is recycled or is superseded by a reload
+    worker.runs_scheduler = getattr(server, 'scheduler_owner', None) is None
+    if worker.runs_scheduler:
+        server.scheduler_owner = worker
+
+
+def post_fork(server, worker):
+    if not worker.runs_scheduler:
+        os.environ['SCHEDULER_ENABLED'] = '0'
+
+
+def on_reload(server):
+    # The arbiter spawns every new worker before stopping the old ones,
+    # so the first new worker must take over from the outgoing owner
+    server.scheduler_owner = None
+
+
+def child_exit(server, worker):
+    if getattr(server, 'scheduler_owner', None) is worker:
+        server.scheduler_owner = None
@@ -1,43 +1,146 @@
 import re, emoji, datetime
+import os
+import sqlite3
+import threading
 import warnings
+from functools import lru_cache
+import pandas as pd
 from bs4 import MarkupResemblesLocatorWarning, BeautifulSoup
 import nltk
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
+from nltk.tokenize import NLTKWordTokenizer
+from geopy.adapters import RequestsAdapter
 from geopy.geocoders import Nominatim
+from geopy.extra.rate_limiter import RateLimiter
 
 # ─── NLTK Setup ───────────────────────────────────────────────────────────
-nltk.download('punkt'); nltk.download('stopwords'); nltk.download('wordnet'); nltk.download('punkt_tab')
-STOP = set(stopwords.words('english'))
+# Only fetch what's missing; images that bake the corpora in set NLTK_SKIP_DOWNLOAD=1
+NLTK_PACKAGES = {'punkt': 'tokenizers/punkt', 'punkt_tab': 'tokenizers/punkt_tab',
+                 'stopwords': 'corpora/stopwords', 'wordnet': 'corpora/wordnet'}
+if os.getenv('NLTK_SKIP_DOWNLOAD') != '1':
+    for pkg, path in NLTK_PACKAGES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(pkg, quiet=True)
+STOP = frozenset(stopwords.words('english'))
 LEMM = WordNetLemmatizer()
-GEO  = Nominatim(user_agent="sentiment_app", timeout=10)
+# One pooled keep-alive connection: lookups are serialized by the rate limit
+# below, so every geocode after the first skips the TCP/TLS handshake
+GEO  = Nominatim(
+    user_agent="sentiment_app", timeout=10,
+    adapter_factory=lambda proxies, ssl_context: RequestsAdapter(
+        proxies=proxies, ssl_context=ssl_context, pool_connections=1, pool_maxsize=1
+    )
+)
+# Nominatim's usage policy allows one request per second; errors still
+# raise (not swallowed) so transient failures are never cached
+GEOCODE = RateLimiter(GEO.geocode, min_delay_seconds=1, max_retries=0,
+                      swallow_exceptions=False)
 
+# Compiled once; clean_text runs for every scraped item
+URL_RE     = re.compile(r'(http\S+|www\S+)')
+MENTION_RE = re.compile(r'@\w+')
+SPACE_RE   = re.compile(r'\s+')
+# Silence the annoying “looks like a URL” warning
+warnings.filterwarnings("ignore", category=MarkupResemblesLocatorWarning)
+
+# Scrapes repeat texts and usernames heavily, so the helpers below are memoized.
+# Cached lists/dicts are shared between callers: treat them as read-only.
+@lru_cache(maxsize=50_000)
 def clean_text(text: str) -> str:
     """Strip HTML, URLs, mentions, emojis; normalize whitespace & case."""
-    # Silence the annoying “looks like a URL” warning
-    warnings.filterwarnings("ignore", category=MarkupResemblesLocatorWarning)
-    # HTML → text
-    text = BeautifulSoup(text, "html.parser").get_text()
+    # HTML → text (lxml's C parser)
+    text = BeautifulSoup(text, "lxml").get_text()
     # URLs & mentions
-    text = re.sub(r'(http\S+|www\S+)', '', text)
-    text = re.sub(r'@\w+', '', text)
+    text = URL_RE.sub('', text)
+    text = MENTION_RE.sub('', text)
     text = text.replace('#','')
-    # emojis
-    text = emoji.replace_emoji(text, replace="")
+    # emojis (every emoji has a non-ASCII codepoint, so ASCII text skips the scan)
+    if not text.isascii():
+        text = emoji.replace_emoji(text, replace="")
     # whitespace & lowercase
-    return re.sub(r'\s+',' ', text).strip().lower()
+    return SPACE_RE.sub(' ', text).strip().lower()
+
+HTML_HINT_RE = re.compile(r'[<&]')  # texts without these parse to themselves
+
+def clean_text_batch(texts: list) -> list:
+    """clean_text over a list, with the regex passes run as pandas string ops."""
+    # Retweets and copy-pasted posts repeat: clean each distinct text once
+    codes, uniques = pd.factorize(pd.Series(texts, dtype=object))
+    s = pd.Series(uniques, dtype=object)
+    # Selenium hands back rendered text, so most items skip the HTML parser
+    html = s.str.contains(HTML_HINT_RE, na=False)
+    if html.any():
+        s[html] = [BeautifulSoup(t, "lxml").get_text() for t in s[html]]
+    s = (s.str.replace(URL_RE, '', regex=True)
+          .str.replace(MENTION_RE, '', regex=True)
+          .str.replace('#', '', regex=False))
+    non_ascii = ~s.map(str.isascii).astype(bool)
+    if non_ascii.any():
+        s[non_ascii] = [emoji.replace_emoji(t, replace="") for t in s[non_ascii]]
+    s = s.str.replace(SPACE_RE, ' ', regex=True).str.strip().str.lower()
+    return s.take(codes).tolist()
+
+# WordNet lookups repeat across texts and batches
+_lemmatize = lru_cache(maxsize=100_000)(LEMM.lemmatize)
+PUNCT_RE = re.compile(r'[^\w\s]')
+
+# word_tokenize's own word splitter, which still splits contractions and
+# fused words ("cannot" -> can, not) when there is no punctuation
+TREEBANK = NLTKWordTokenizer()
+
+def _tokens(text: str) -> list:
+    # Punkt only finds sentence breaks at punctuation; without any, the
+    # whole text is one sentence and goes straight to the word splitter
+    return nltk.word_tokenize(text) if PUNCT_RE.search(text) else TREEBANK.tokenize(text)
 
+@lru_cache(maxsize=50_000)
 def tokenize_and_lemmatize(text: str) -> list:
     """Tokenize, remove stop-words, non-alpha, and lemmatize."""
-    tokens = nltk.word_tokenize(text)
-    toks = [t for t in tokens if t.isalpha() and t not in STOP]
-    return [LEMM.lemmatize(t) for t in toks]
+    return [_lemmatize(t) for t in _tokens(text) if t.isalpha() and t not in STOP]
+
+def tokenize_and_lemmatize_batch(texts: list) -> list:
+    """tokenize_and_lemmatize over a list, sharing the lemma cache."""
+    return [[_lemmatize(t) for t in _tokens(text) if t.isalpha() and t not in STOP]
+            for text in texts]
+
+# ─── Geocoding cache ──────────────────────────────────────────────────────
+# Lookups survive restarts in SQLite (misses too, as NULL coordinates)
+GEOCODE_DB = os.getenv('GEOCODE_CACHE_PATH', os.path.join('cache', 'geocode.sqlite'))
+os.makedirs(os.path.dirname(GEOCODE_DB) or '.', exist_ok=True)
+
+def reopen_geocode_cache():
+    """(Re)open the SQLite cache; call in each forked child, as a connection
+    (and a lock another thread may hold) must not cross a fork."""
+    global _geo_db, _geo_db_lock
+    _geo_db = sqlite3.connect(GEOCODE_DB, check_same_thread=False)
+    _geo_db.execute('CREATE TABLE IF NOT EXISTS geocode '
+                    '(loc TEXT PRIMARY KEY, latitude REAL, longitude REAL)')
+    _geo_db.commit()
+    _geo_db_lock = threading.Lock()
+
+reopen_geocode_cache()
+
+@lru_cache(maxsize=100_000)
+def _geocode_cached(loc: str):
+    with _geo_db_lock:
+        row = _geo_db.execute('SELECT latitude, longitude FROM geocode WHERE loc = ?',
+                              (loc,)).fetchone()
+    if row is None:
+        # raises on network errors so transient failures are not cached
+        res = GEOCODE(loc)
+        row = (res.latitude, res.longitude) if res else (None, None)
+        with _geo_db_lock:
+            _geo_db.execute('INSERT OR REPLACE INTO geocode VALUES (?, ?, ?)', (loc, *row))
+            _geo_db.commit()
+    return {'latitude': row[0], 'longitude': row[1]} if row[0] is not None else None
 
 def geocode_location(loc: str):
     """Return {'lat','lon'} or None for a free-form location."""
     if not loc: return None
     try:
-        res = GEO.geocode(loc)
-        return {'latitude': res.latitude, 'longitude': res.longitude} if res else None
+        return _geocode_cached(loc)
     except Exception:
         return None
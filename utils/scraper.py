@@ -1,14 +1,17 @@
 import os
+import json
 import time
+import queue
+import atexit
 import logging
+from concurrent import futures
+from itertools import repeat
 from urllib.parse import quote_plus
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 logger = logging.getLogger('sentiment_logger')
 
@@ -16,22 +19,56 @@ logger = logging.getLogger('sentiment_logger')
 X_DOMAIN     = "https://x.com"
 SEARCH_FMT   = X_DOMAIN + "/search?q={q}&f={tab}"  # tab: 'top' or 'live'
 
-# Selectors
-TWEET_XPATH      = "//article[@data-testid='tweet']"
+# Selectors (CSS: the browser's native querySelector, no XPath evaluation)
+TWEET_CSS        = "article[data-testid='tweet']"
+TWEET_TEXT_CSS   = "div[data-testid='tweetText']"
+TWEET_USER_CSS   = "div[dir='ltr'] > span"
+TWEET_TIME_CSS   = "time"
 VIEWPORT_SCROLL  = "window.scrollBy(0, window.innerHeight);"
+# Reads every card in one WebDriver call (vs. three find_element trips per card);
+# cards missing a field come back as null and are skipped
+FETCH_CARDS_JS   = f"""
+return Array.from(document.querySelectorAll({json.dumps(TWEET_CSS)}), a => {{
+  const txt = a.querySelector({json.dumps(TWEET_TEXT_CSS)});
+  const usr = a.querySelector({json.dumps(TWEET_USER_CSS)});
+  const dt  = a.querySelector({json.dumps(TWEET_TIME_CSS)});
+  return txt && usr && dt
+    ? [txt.innerText.trim(), usr.innerText.trim(), dt.getAttribute("datetime")] : null;
+}});
+"""
 
 # Scrolling parameters
-LOAD_WAIT        = 10    # seconds to wait after each scroll
+LOAD_WAIT        = 10    # max seconds to wait for new tweets after each scroll
+POLL_INTERVAL    = 0.25  # seconds between checks while waiting
 MAX_STABLE       = 3     # stop after this many passes with no new tweets
 
+# Warm drivers kept between scrapes, per headless mode (Chrome takes seconds to start)
+DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', 4))
+_DRIVER_POOL     = {True: queue.LifoQueue(), False: queue.LifoQueue()}
+# Search tabs scroll in parallel, one browser each; shared by every caller,
+# so it also caps how many browsers are open at once
+_TAB_POOL        = futures.ThreadPoolExecutor(max_workers=DRIVER_POOL_SIZE,
+                                              thread_name_prefix='x-tab')
+
 
 def _init_driver(headless: bool):
     """Initialize Chrome WebDriver with stealth settings."""
     opts = webdriver.ChromeOptions()
     opts.add_argument("--disable-blink-features=AutomationControlled")
     opts.add_argument("window-size=1280,1024")
+    # Only text is scraped: skip images, autoplaying video and extensions to
+    # cut each pooled browser's memory, bandwidth and render work.
+    # Stylesheets stay on: innerText and the infinite scroll depend on layout.
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_argument("--autoplay-policy=user-gesture-required")
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.media_stream": 2,
+    })
     if headless:
         opts.add_argument("--headless=new")
+        opts.add_argument("--disable-gpu")
     if ssl := os.getenv('SSL_CERT_FILE'):
         opts.add_argument(f"--ssl-client-certificate={ssl}")
     drv = webdriver.Chrome(options=opts)
@@ -43,6 +80,57 @@ def _init_driver(headless: bool):
     return drv
 
 
+def _acquire_driver(headless: bool):
+    """Reuse a pooled driver (already logged in) or start a fresh one."""
+    try:
+        return _DRIVER_POOL[headless].get_nowait()
+    except queue.Empty:
+        drv = _init_driver(headless)
+        try:
+            # restore login session once per browser
+            _load_cookies("X_COOKIES_PATH", drv, X_DOMAIN)
+        except Exception:
+            drv.quit()
+            raise
+        return drv
+
+
+def _release_driver(driver, headless: bool, healthy: bool=True):
+    """Return a driver to the pool, or quit it if broken or the pool is full."""
+    pool = _DRIVER_POOL[headless]
+    if healthy and pool.qsize() < DRIVER_POOL_SIZE:
+        try:
+            # drop the scrolled timeline's DOM and stop its background polling
+            driver.get("about:blank")
+        except WebDriverException:
+            pass
+        else:
+            pool.put(driver)
+            return
+    with suppress(Exception):
+        driver.quit()
+
+
+@contextmanager
+def pooled_driver(headless: bool):
+    """Borrow a logged-in driver; it goes back to the pool unless the block raised."""
+    driver = _acquire_driver(headless)
+    healthy = False
+    try:
+        yield driver
+        healthy = True
+    finally:
+        _release_driver(driver, headless, healthy)
+
+
+@atexit.register
+def _close_pooled_drivers():
+    for pool in _DRIVER_POOL.values():
+        while not pool.empty():
+            with suppress(Exception):
+                pool.get_nowait().quit()
+
+
 def _safe_get(driver, url: str) -> bool:
     """Navigate to URL, retrying once on TimeoutException."""
     try:
@@ -66,7 +154,7 @@ def _load_cookies(env_key: str, driver, domain: str):
     driver.get(domain)
     cookies = []
     try:
-        import json, pickle
+        import pickle
         # prefer JSON, fallback to pickle
         with open(path, encoding='utf-8') as f:
             cookies = json.load(f)
@@ -84,54 +172,51 @@ def _load_cookies(env_key: str, driver, domain: str):
     logger.debug("Loaded %d cookies from %s", len(cookies), env_key)
 
 
-def _fetch_all(driver):
+def _read_cards(driver, scroll: bool=False):
     """
-    Return list of (text, user, date) tuples for every tweet on page.
+    Return one entry per tweet card on page, [text, user, date] or None for
+    a card missing a field (media-only, still rendering), optionally
+    scrolling one viewport first in the same WebDriver call.
     """
-    out = []
-    cards = driver.find_elements(By.XPATH, TWEET_XPATH)
-    for c in cards:
-        try:
-            txt = c.find_element(By.XPATH, ".//div[@data-testid='tweetText']").text.strip()
-            usr = c.find_element(By.XPATH, ".//div[@dir='ltr']/span").text.strip()
-            dt  = c.find_element(By.TAG_NAME, "time").get_attribute("datetime")
-            out.append((txt, usr, dt))
-        except WebDriverException:
-            continue
-    return out
+    try:
+        script = VIEWPORT_SCROLL + FETCH_CARDS_JS if scroll else FETCH_CARDS_JS
+        return driver.execute_script(script) or []
+    except WebDriverException:
+        return []
+
+
+def _fetch_all(driver, scroll: bool=False):
+    """Return list of (text, user, date) tuples for every tweet on page."""
+    return [tuple(c) for c in _read_cards(driver, scroll) if c]
 
 
 def _scrape_tab(driver):
     """
     Scroll‑and‑collect tweets from the current X.com tab.
-    Scroll one viewport at a time, pausing LOAD_WAIT for new tweets,
+    Scroll one viewport at a time, waiting up to LOAD_WAIT for new tweets,
     stopping after MAX_STABLE passes with no growth.
     """
-    # wait for tweets to appear
-    WebDriverWait(driver, 30).until(
-        EC.presence_of_element_located((By.XPATH, TWEET_XPATH))
-    )
-    collected = _fetch_all(driver)
+    # wait for tweet cards to appear, text or not (a first screen of media
+    # cards is left to the scroll loop); the poll itself reads them, so the
+    # first batch costs no extra round-trip
+    first = WebDriverWait(driver, 30, poll_frequency=POLL_INTERVAL).until(_read_cards)
+    # insertion-ordered dict as an ordered set: O(1) membership, page order
+    collected = dict.fromkeys(tuple(c) for c in first if c)
     stable = 0
 
     while stable < MAX_STABLE:
         prev_count = len(collected)
-        # scroll one viewport
-        driver.execute_script(VIEWPORT_SCROLL)
-
-        # wait up to LOAD_WAIT for count to increase
+        # scroll one viewport and read the cards in one round-trip, then wait
+        # up to LOAD_WAIT for an unseen one (X recycles cards as it scrolls,
+        # so the on-page count never outgrows `collected`)
         deadline = time.time() + LOAD_WAIT
-        new_list = collected
-        while time.time() < deadline:
+        new_list = _fetch_all(driver, scroll=True)
+        while not any(t not in collected for t in new_list) and time.time() < deadline:
+            time.sleep(POLL_INTERVAL)
             new_list = _fetch_all(driver)
-            if len(new_list) > prev_count:
-                break
-            time.sleep(0.5)
 
         # merge new
-        for t in new_list:
-            if t not in collected:
-                collected.append(t)
+        collected.update(dict.fromkeys(new_list))
 
         # track stability
         if len(collected) == prev_count:
@@ -141,47 +226,51 @@ def _scrape_tab(driver):
             stable = 0
             logger.debug("Found %d posts so far", len(collected))
 
-    # convert to dicts
-    return [{"content": t[0], "username": t[1], "date": t[2]} for t in collected]
+    # (text, user, date) tuples; scrape_x dedupes across tabs on them as-is
+    return list(collected)
+
+
+def _scrape_url(url: str, headless: bool):
+    """Scrape one search tab on a pooled driver; [] if it fails.
+    Returns (text, user, date) tuples."""
+    try:
+        with pooled_driver(headless) as driver:
+            if not _safe_get(driver, url):
+                return []
+            try:
+                return _scrape_tab(driver)
+            except TimeoutException:
+                # no tweets for this search; the browser itself is fine
+                logger.info("No posts found at %s", url)
+                return []
+    except Exception as e:
+        # pooled_driver has already quit the possibly wedged browser
+        logger.exception("scrape_x error on %s: %s", url, e)
+        return []
 
 
 def scrape_x(keywords: str, headless: bool=False):
     """
     Accept either a single keyword or list of keywords.
-    Scrape all tweets from both the Top (f=top) and Latest (f=live) tabs for `keyword`.
+    Scrape all tweets from both the Top (f=top) and Latest (f=live) tabs for `keyword`,
+    each tab in its own browser concurrently.
     De‑duplicates across both tabs (globally).
     Returns list of dicts: {'content','username','date'}.
     """
     logger.info("Scraping X.com for '%s' (Top + Live)", keywords)
     if isinstance(keywords,str): keywords=[keywords]
-    driver = _init_driver(headless)
-    all_tweets = []
-    seen = set()
-    try:
-        # restore login session
-        _load_cookies("X_COOKIES_PATH", driver, X_DOMAIN)
-        for kw in keywords:
-        # iterate over both tabs
-            for tab in ("top", "live"):
-                url = SEARCH_FMT.format(q=quote_plus(kw), tab=tab)
-                if not _safe_get(driver, url):
-                    continue
-                tweets = _scrape_tab(driver)
-                # dedupe across both tabs
-                for t in tweets:
-                    key = (t['username'], t['date'], t['content'])
-                    if key not in seen:
-                        seen.add(key)
-                        all_tweets.append(t)
-
-        logger.info("Collected %d unique posts in total", len(all_tweets))
-        return all_tweets
+    urls = [SEARCH_FMT.format(q=quote_plus(kw), tab=tab)
+            for kw in keywords for tab in ("top", "live")]
+    # dict.fromkeys dedupes across tabs on the tuples and keeps first-seen order;
+    # map keeps tab order, so the merged list matches the sequential one
+    unique = dict.fromkeys(
+        t for tweets in _TAB_POOL.map(_scrape_url, urls, repeat(headless)) for t in tweets
+    )
+    # convert to dicts only once per unique tweet
+    all_tweets = [{"content": c, "username": u, "date": d} for c, u, d in unique]
 
-    except Exception as e:
-        logger.exception("scrape_x error: %s", e)
-        return []
-    finally:
-        driver.quit()
+    logger.info("Collected %d unique posts in total", len(all_tweets))
+    return all_tweets
 
 def scrape_facebook(_keywords: str, _headless: bool=False):
     """
@@ -1,48 +1,139 @@
 import os
 import json
+import hashlib
+import threading
+from collections import OrderedDict
+import torch
+from torch.ao.quantization import quantize_dynamic
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from transformers import pipeline
 
 # ─── Setup ─────────────────────────────────────────────────
+BATCH_SIZE = 64 if torch.cuda.is_available() else 32  # texts per BERT forward pass
+# cached results, evicted least-recently-used; ~1 KB each
+CACHE_SIZE = int(os.getenv('SENTIMENT_CACHE_SIZE', 50_000))
+
+MODEL_NAME = "nlptown/bert-base-multilingual-uncased-sentiment"
+
+# Models load once per process at import and are shared by every request.
+# Run on the first GPU in fp16 when there is one; otherwise on the CPU.
+DEVICE = 0 if torch.cuda.is_available() else -1
+# CPU intra-op threads per process. Every gunicorn worker and Celery child
+# holds its own model, so each claiming every core makes them thrash;
+# unset (0) keeps torch's default
+TORCH_THREADS = int(os.getenv('TORCH_THREADS', 0))
+
+def set_cpu_threads(n: int):
+    """Size torch's CPU thread pool for this process (no-op on GPU or n <= 0)."""
+    if DEVICE < 0 and n > 0:
+        torch.set_num_threads(n)
+
+set_cpu_threads(TORCH_THREADS)
 vader = SentimentIntensityAnalyzer()
 multilingual_bert = pipeline(
     "sentiment-analysis",
-    model="nlptown/bert-base-multilingual-uncased-sentiment"
+    model=MODEL_NAME,
+    device=DEVICE,
+    torch_dtype=torch.float16 if DEVICE >= 0 else torch.float32
 )
+# On CPU, int8 dynamic quantization of the Linear layers roughly halves
+# matmul cost, but shifts bert_sentiment scores (occasionally labels) away
+# from those already stored; opt in with SENTIMENT_INT8=1.
+if DEVICE < 0 and os.getenv('SENTIMENT_INT8', '0') == '1':
+    multilingual_bert.model = quantize_dynamic(
+        multilingual_bert.model, {torch.nn.Linear}, dtype=torch.qint8
+    )
 
 # Load Kiswahili lexicon
 LEX_PATH = os.path.join(os.path.dirname(__file__), 'lexicons', 'swahili_lexicon.json')
 with open(LEX_PATH, encoding='utf-8') as f:
     sw_lex = json.load(f)
 
+# Results keyed by text digest; re-scrapes and reposts hit this
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
 # ─── Helpers ───────────────────────────────────────────────
-def is_swahili(text: str) -> bool:
-    words = text.lower().split()
+def is_swahili(text: str, words: list=None) -> bool:
+    if words is None:
+        words = text.lower().split()
     if not words:
         return False
     sw_count = sum(1 for w in words if w in sw_lex)
     return (sw_count / len(words)) > 0.3
 
-def swahili_lexicon_score(text: str) -> str:
-    score = sum(sw_lex.get(w, 0) for w in text.lower().split())
+def swahili_lexicon_score(text: str, words: list=None) -> str:
+    if words is None:
+        words = text.lower().split()
+    score = sum(sw_lex.get(w, 0) for w in words)
     if score > 0:
         return 'positive'
     elif score < 0:
         return 'negative'
     return 'neutral'
 
-# ─── Main API ──────────────────────────────────────────────
-def analyze_sentiment(text: str) -> dict:
-    tb = TextBlob(text).sentiment.polarity
-    vd = vader.polarity_scores(text)
-    bt = multilingual_bert(text)[0]
-    sw = swahili_lexicon_score(text) if is_swahili(text) else None
+def _text_key(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+def _cache_get(key: str):
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            _cache.move_to_end(key)
+        return hit
 
+def _cache_put(key: str, result: dict):
+    with _cache_lock:
+        _cache[key] = result
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+def _score(text: str, bt: dict) -> dict:
+    """Combine the cheap scorers with a precomputed BERT result."""
+    words = text.lower().split()  # shared by both Swahili checks
     return {
         'text': text,
-        'textblob_polarity': tb,
-        'vader': vd,
+        'textblob_polarity': TextBlob(text).sentiment.polarity,
+        'vader': vader.polarity_scores(text),
         'bert_sentiment': bt,
-        'swahili_sentiment': sw
+        'swahili_sentiment': (swahili_lexicon_score(text, words)
+                              if is_swahili(text, words) else None)
     }
+
+# ─── Main API ──────────────────────────────────────────────
+# Callers mutate the returned dicts, so cached results are handed out as copies.
+def analyze_sentiment(text):
+    """Score one text, or a list of texts in batches (see analyze_sentiment_batch)."""
+    if isinstance(text, str):
+        return analyze_sentiment_batch([text])[0]
+    return analyze_sentiment_batch(list(text))
+
+def analyze_sentiment_batch(texts: list) -> list:
+    """Like analyze_sentiment, but runs BERT over the whole list in batches."""
+    keys = [_text_key(t) for t in texts]
+    found = {}
+    misses = {}  # key -> text, unique texts only
+    for key, text in zip(keys, texts):
+        if key in found or key in misses:
+            continue
+        hit = _cache_get(key)
+        if hit is None:
+            misses[key] = text
+        else:
+            found[key] = hit
+
+    if misses:
+        # sort by length so each padded batch holds similar-sized texts
+        todo = sorted(misses.items(), key=lambda kv: len(kv[1]))
+        # inference_mode is stricter than the pipeline's own no_grad: no
+        # version counters or view tracking on the activations
+        with torch.inference_mode():
+            bert = multilingual_bert([t for _, t in todo],
+                                     batch_size=BATCH_SIZE, truncation=True)
+        for (key, text), bt in zip(todo, bert):
+            found[key] = _score(text, bt)
+            _cache_put(key, found[key])
+
+    return [dict(found[key]) for key in keys]
@@ -13,7 +13,8 @@ def run_topic_modeling(texts,
                        doc_topic_prior=None,
                        topic_word_prior=None,
                        display_rule='fixed',
-                       weight_threshold=0.01):
+                       weight_threshold=0.01,
+                       n_jobs=None):
     """
     Fit LDA on `texts` with tunable priors, return:
       • vectorizer: CountVectorizer instance
@@ -23,7 +24,9 @@ def run_topic_modeling(texts,
           - name (human-friendly label)
           - top_keywords: list of (word, prob)
           - full_distribution: {word: prob}
+      • doc_topic_dist: (n_texts, num_topics) topic mixture per input text
     display_rule: 'fixed' (top N) or 'threshold' (all above threshold)
+    n_jobs: worker processes for the LDA E-step (-1 = all cores)
     """
     # 1) Convert texts to term-frequency matrix
     vectorizer = CountVectorizer(stop_words='english')
@@ -32,13 +35,16 @@ def run_topic_modeling(texts,
     # 2) Configure and fit LDA with optional Dirichlet priors
     lda_kwargs = {'n_components': num_topics,
                   'random_state': 42,
-                  'learning_method': 'batch'}
+                  'learning_method': 'batch',
+                  'n_jobs': n_jobs}
     if doc_topic_prior is not None:
         lda_kwargs['doc_topic_prior'] = doc_topic_prior
     if topic_word_prior is not None:
         lda_kwargs['topic_word_prior'] = topic_word_prior
     lda = LatentDirichletAllocation(**lda_kwargs)
     lda.fit(X)
+    # Reuse the fitted term matrix so callers never re-vectorize the corpus
+    doc_topic_dist = lda.transform(X)
 
     # 3) Compute full topic-word probability distributions
     #    Normalize each topic row to sum to 1
@@ -65,13 +71,14 @@ def run_topic_modeling(texts,
             'top_keywords': top_keywords,
             'full_distribution': full_dist
         })
-    return vectorizer, lda, topics
+    return vectorizer, lda, topics, doc_topic_dist
 
 
 def run_topic_modeling_by_phase(texts, phases, **kwargs):
     """
     Fit separate LDA models for each unique phase label in `phases`.
-    Returns dict: phase -> (vectorizer, lda, topics).
+    Returns dict: phase -> (vectorizer, lda, topics, doc_topic_dist), where
+    the distribution rows follow that phase's texts in their original order.
     """
     results = {}
     # Iterate over each phase (e.g. 'during', 'after')
@@ -81,32 +88,35 @@ def run_topic_modeling_by_phase(texts, phases, **kwargs):
         # Only fit if we have data
         if not sub_texts:
             continue
-        vec, lda, topics = run_topic_modeling(sub_texts, **kwargs)
-        results[phase] = (vec, lda, topics)
+        results[phase] = run_topic_modeling(sub_texts, **kwargs)
     return results
 
 
-def plot_topic_barchart(topic_id, top_keywords):
+def plot_topic_barchart(topic_id, top_keywords, ax=None):
     """
     Plot a horizontal bar chart for a single topic's top keywords.
+    Draws on `ax` when given (e.g. a reused Figure), else a new pyplot figure.
     """
     words, weights = zip(*top_keywords)
-    plt.figure()
-    plt.barh(words, weights)
-    plt.xlabel('Probability')
-    plt.title(f'Topic {topic_id} Top Words')
-    plt.gca().invert_yaxis()  # largest on top
-    plt.tight_layout()
+    if ax is None:
+        ax = plt.figure().gca()
+    ax.barh(words, weights)
+    ax.set_xlabel('Probability')
+    ax.set_title(f'Topic {topic_id} Top Words')
+    ax.invert_yaxis()  # largest on top
+    ax.figure.tight_layout()
 
 
-def plot_topic_wordcloud(topic_id, full_distribution):
+def plot_topic_wordcloud(topic_id, full_distribution, ax=None):
     """
     Generate and display a word cloud for a single topic.
+    Draws on `ax` when given, else a new pyplot figure.
     """
     wc = WordCloud(width=800, height=400, background_color='white')
     wc.generate_from_frequencies(full_distribution)
-    plt.figure(figsize=(10, 5))
-    plt.imshow(wc, interpolation='bilinear')
-    plt.axis('off')
-    plt.title(f'Topic {topic_id} Word Cloud')
-    plt.tight_layout()
+    if ax is None:
+        ax = plt.figure(figsize=(10, 5)).gca()
+    ax.imshow(wc, interpolation='bilinear')
+    ax.axis('off')
+    ax.set_title(f'Topic {topic_id} Word Cloud')
+    ax.figure.tight_layout()
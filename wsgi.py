@@ -0,0 +1,13 @@
+"""
+Production entrypoint.
+
+    gunicorn -c gunicorn.conf.py
+
+gevent must patch sockets before pymongo/requests/selenium are imported,
+so the patch runs here, ahead of the app import. Use `python app.py`
+for local debugging.
+"""
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402